@@ -40,6 +40,13 @@ namespace splinepy::py {
 
 namespace py = pybind11;
 
+/// checks if all knots are within knot vector's range, raises ValueError if
+/// not
+void CheckKnotsInRange(const std::shared_ptr<PySpline>& spline,
+                       const int para_dim,
+                       const double* knots_ptr,
+                       const int n_knots);
+
 /// (multiple) knot insertion, single dimension
 py::array_t<bool> InsertKnots(std::shared_ptr<PySpline>& spline,
                               int para_dim,
@@ -51,6 +58,9 @@ py::list RemoveKnots(std::shared_ptr<PySpline>& spline,
                      py::array_t<double> knots,
                      double tolerance);
 
+/// scales all knot vectors to [0, 1] in place
+void NormalizeKnotVectors(std::shared_ptr<PySpline>& spline);
+
 /// spline multiplication - currently only for bezier
 std::shared_ptr<PySpline> Multiply(const std::shared_ptr<PySpline>& a,
                                    const std::shared_ptr<PySpline>& b);
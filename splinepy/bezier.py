@@ -367,7 +367,8 @@ class Bezier(BezierBase):
     @property
     def rationalbezier(self):
         return _settings.NAME_TO_TYPE["RationalBezier"](
-            **self.todict(), weights=_np.ones((self.cps.shape[0], 1))
+            **self.todict(),
+            weights=_np.broadcast_to(1.0, (self.cps.shape[0], 1)),
         )
 
     @property
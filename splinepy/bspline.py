@@ -97,23 +97,17 @@ class BSplineBase(_spline.Spline):
         if isinstance(knots, float):
             knots = [knots]
 
+        knots = _utils.data.enforce_contiguous(
+            knots, dtype="float64", asarray=True
+        )
+
         if len(knots) == 0:
             self._logd("Requesting knot insertion for 0 knots, no computation")
             return []
 
-        if max(knots) > max(self.knot_vectors[parametric_dimension]):
-            raise ValueError(
-                "One of the query knots not in valid knot range. (Too big)"
-            )
-
-        if min(knots) < min(self.knot_vectors[parametric_dimension]):
-            raise ValueError(
-                "One of the query knots not in valid knot range. "
-                "(Too small)"
-            )
-
+        # core raises ValueError for knots outside the knot vector's range
         inserted = _splinepy_core.insert_knots(
-            self, parametric_dimension, _utils.data.enforce_contiguous(knots)
+            self, parametric_dimension, knots
         )
 
         self._logd(f"Inserted {len(knots)} knot(s).")
@@ -292,25 +286,19 @@ class BSplineBase(_spline.Spline):
         if isinstance(knots, float):
             knots = [knots]
 
+        knots = _utils.data.enforce_contiguous(
+            knots, dtype="float64", asarray=True
+        )
+
         if len(knots) == 0:
             self._logd("Requesting knot removal of 0 knots, no computation")
             return []
 
-        if max(knots) > max(self.knot_vectors[parametric_dimension]):
-            raise ValueError(
-                "One of the query knots not in valid knot range. (Too big)"
-            )
-
-        if min(knots) < min(self.knot_vectors[parametric_dimension]):
-            raise ValueError(
-                "One of the query knots not in valid knot range. "
-                "(Too small)"
-            )
-
+        # core raises ValueError for knots outside the knot vector's range
         removed = _splinepy_core.remove_knots(
             self,
             parametric_dimension,
-            _utils.data.enforce_contiguous(knots),
+            knots,
             tolerance=_spline._default_if_none(tolerance, _settings.TOLERANCE),
         )
 
@@ -340,9 +328,8 @@ class BSplineBase(_spline.Spline):
                 "Please, first initialize spline before normalize_knot_vectors."
             )
 
-        for kv in self.knot_vectors:
-            if isinstance(kv, _splinepy_core.KnotVector):
-                kv.scale(0, 1)
+        # scales in-place, inside core. already normalized kvs are skipped
+        _splinepy_core.normalize_knot_vectors(self)
 
     def extract_bezier_patches(self):
         """
@@ -492,7 +479,7 @@ class BSpline(BSplineBase):
         """
         same_nurbs = _settings.NAME_TO_TYPE["NURBS"](
             **self.todict(),
-            weights=_np.ones(self.control_points.shape[0], dtype=_np.float64),
+            weights=_np.broadcast_to(1.0, self.control_points.shape[0]),
         )
 
         return same_nurbs
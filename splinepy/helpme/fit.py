@@ -1,7 +1,6 @@
 import numpy as _np
 
 from splinepy import settings as _settings
-from splinepy.helpme.multi_index import MultiIndex
 from splinepy.utils import log as _log
 from splinepy.utils.data import has_scipy as _has_scipy
 from splinepy.utils.data import make_matrix as _make_matrix
@@ -73,10 +72,14 @@ def parameterize(fitting_points, size, centripetal):
 
         return u_k.reshape(-1, 1)
 
-    mi = MultiIndex(size)
+    # same layout as indexing with MultiIndex(size), but as a view
+    # - points are raveled with the first parametric dimension running fastest
+    n_para = len(size)
+    reorganized = fitting_points.reshape(*size[::-1], -1).transpose(
+        *range(n_para - 1, -1, -1), n_para
+    )
 
     # Loop over all dimensions and append each para_coords to list
-    reorganized = fitting_points[mi._raveled_indices]
     parametric_coordinates = []
     for k in range(len(size)):
         parametric_coordinates.append(
@@ -180,10 +183,8 @@ def solve_for_control_points(
 
         if fitting_spline.control_points.shape[0] == 2:
             # control points equal to endpoints (straight line)
-            residual = _np.linalg.norm(
-                coefficient_matrix @ fitting_spline.control_points
-                - fitting_points
-            )
+            # nothing to solve. residual is computed below
+            pass
         elif _has_scipy:
             # move known values to RHS
             rhs[1:-1, :] -= (
@@ -232,6 +233,10 @@ def _validate_specifications(n_query, degree, n_control_points, knot_vector):
     """Given main values of fitting, validates degree and n_control_points.
     If there's mismatch between expected value and given value, values will be
     overwritten."""
+    # empty knot vector is the same as not given
+    if knot_vector is not None and len(knot_vector) == 0:
+        knot_vector = None
+
     # sanity checks for given values
     if degree is not None and knot_vector is not None:
         expected_ncps = len(knot_vector) - degree - 1
@@ -353,7 +358,9 @@ def curve(
 
     # determine evaluation points to build a linear system
     if associated_queries is not None:
-        u_k = _np.asanyarray(associated_queries)
+        # contiguous float64 queries are passed through as they are and
+        # won't be converted again in basis evaluations
+        u_k = _np.ascontiguousarray(associated_queries, dtype="float64")
         if u_k.shape[1] != 1:
             raise ValueError("Associated queries need to have (-1, 1) shape")
 
@@ -472,8 +479,9 @@ def surface(
             raise ValueError(
                 "Associated queries in each direction must have dimension 1!"
             )
-        u_k[0] = _np.asanyarray(associated_queries[0])
-        u_k[1] = _np.asanyarray(associated_queries[1])
+        # convert once, as they are reused for every curve fit
+        u_k[0] = _np.ascontiguousarray(associated_queries[0], dtype="float64")
+        u_k[1] = _np.ascontiguousarray(associated_queries[1], dtype="float64")
 
     else:
         u_k = parameterize(
@@ -529,28 +537,27 @@ def surface(
 
     n_control_points = fitted_spline.control_mesh_resolutions
 
-    # index helpers
-    mi_pts = MultiIndex(size)
-    mi_interim_cps = MultiIndex((n_control_points[0], size[1]))
+    # grid views. points are raveled with first parametric dimension
+    # running fastest, i.e., `grid[v, u]`. this saves a fancy-index gather
+    # per curve fit.
+    grid_points = fitting_points.reshape(size[1], size[0], dim)
+    interim_control_points = _np.empty((size[1], n_control_points[0], dim))
 
     # loop first dim
     # curve fit for every j in n_points_v
-    interim_control_points = _np.empty((n_control_points[0] * size[1], dim))
     residual_u = _np.empty(size[1])
     fitted_spline_u = fitting_splines[0]
     for v in range(size[1]):
         # previously fitted spline is used for the other fits
         fitted_spline_u, residual_u[v] = curve(
-            fitting_points=fitting_points[mi_pts[:, v]],
+            fitting_points=grid_points[v],
             fitting_spline=fitted_spline_u,
             associated_queries=u_k[0],
             centripetal=centripetal,
             interpolate_endpoints=interpolate_endpoints,
         )
         # cps in u direction (later fitted in v direction)
-        interim_control_points[mi_interim_cps[:, v]] = (
-            fitted_spline_u.control_points
-        )
+        interim_control_points[v] = fitted_spline_u.control_points
 
     # loop second dim
     # curve fit for every k in n_control_points_u
@@ -559,21 +566,21 @@ def surface(
     for u in range(n_control_points[0]):
         # previously fitted spline is used for the other fits
         fitted_spline_v, residual_v[u] = curve(
-            fitting_points=interim_control_points[mi_interim_cps[u, :]],
+            fitting_points=interim_control_points[:, u],
             fitting_spline=fitted_spline_v,
             associated_queries=u_k[1],
             centripetal=centripetal,
             interpolate_endpoints=interpolate_endpoints,
         )
 
-        interim_control_points[mi_interim_cps[u, : n_control_points[1]]] = (
+        interim_control_points[: n_control_points[1], u] = (
             fitted_spline_v.control_points
         )
 
     # copy
     fitted_spline.control_points = interim_control_points[
-        mi_interim_cps[: n_control_points[0], : n_control_points[1]]
-    ]
+        : n_control_points[1]
+    ].reshape(-1, dim)
 
     residual = _np.linalg.norm(
         (_np.linalg.norm(residual_u), _np.linalg.norm(residual_v))
@@ -22,6 +22,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 */
 
+#include <string>
+#include <unordered_map>
+
+#include <BSplineLib/ParameterSpaces/knot_vector.hpp>
+
 #include "splinepy/py/py_spline_extensions.hpp"
 #include "splinepy/splines/helpers/scalar_type_wrapper.hpp"
 #include "splinepy/utils/arrays.hpp"
@@ -30,12 +35,41 @@ namespace splinepy::py {
 
 namespace py = pybind11;
 
+/// checks if all knots are within knot vector's range. raises ValueError
+/// otherwise
+void CheckKnotsInRange(const std::shared_ptr<PySpline>& spline,
+                       const int para_dim,
+                       const double* knots_ptr,
+                       const int n_knots) {
+  if (para_dim < 0 || para_dim >= spline->para_dim_) {
+    throw py::value_error("Invalid parametric dimension.");
+  }
+
+  // knot vectors are non-decreasing - end knots are the bounds
+  const auto kv = spline->Core()->SplinepyKnotVector(para_dim);
+  const double lower_bound = kv->GetFront();
+  const double upper_bound = kv->GetBack();
+
+  for (int i{}; i < n_knots; ++i) {
+    if (knots_ptr[i] > upper_bound) {
+      throw py::value_error(
+          "One of the query knots not in valid knot range. (Too big)");
+    }
+    if (knots_ptr[i] < lower_bound) {
+      throw py::value_error(
+          "One of the query knots not in valid knot range. (Too small)");
+    }
+  }
+}
+
 py::array_t<bool> InsertKnots(std::shared_ptr<PySpline>& spline,
                               int para_dim,
                               py::array_t<double> knots) {
   double* knots_ptr = static_cast<double*>(knots.request().ptr);
   const int n_request = knots.size();
 
+  CheckKnotsInRange(spline, para_dim, knots_ptr, n_request);
+
   // let's argsort, get unique, get multiplicity
   splinepy::utils::Array<double, 1, int> knot_request_view(knots_ptr,
                                                            n_request);
@@ -69,6 +103,8 @@ py::list RemoveKnots(std::shared_ptr<PySpline>& spline,
   double* knots_ptr = static_cast<double*>(knots.request().ptr);
   const int n_request = knots.size();
 
+  CheckKnotsInRange(spline, para_dim, knots_ptr, n_request);
+
   py::list successful;
   for (int i{}; i < n_request; ++i) {
     successful.append(
@@ -78,6 +114,16 @@ py::list RemoveKnots(std::shared_ptr<PySpline>& spline,
   return successful;
 }
 
+void NormalizeKnotVectors(std::shared_ptr<PySpline>& spline) {
+  for (int i{}; i < spline->para_dim_; ++i) {
+    const auto kv = spline->Core()->SplinepyKnotVector(i);
+    // skip already normalized ones
+    if (kv->GetFront() != 0.0 || kv->GetBack() != 1.0) {
+      kv->Scale(0.0, 1.0);
+    }
+  }
+}
+
 std::shared_ptr<PySpline> Multiply(const std::shared_ptr<PySpline>& a,
                                    const std::shared_ptr<PySpline>& b) {
   // performs runtime checks and throws error
@@ -153,9 +199,21 @@ py::list Split(const std::shared_ptr<PySpline>& spline,
 /// bezier patch extraction.
 py::list ExtractBezierPatches(const std::shared_ptr<PySpline>& spline) {
   const auto sp_patches = spline->Core()->SplinepyExtractBezierPatches();
+  // same as PySpline::ToDerived(), but derived types are looked up only once
+  // per spline name. Usually, all the patches share the same type.
+  const auto name_to_type =
+      py::module_::import("splinepy").attr("settings").attr("NAME_TO_TYPE");
+  std::unordered_map<std::string, py::object> derived_types{};
   py::list patches;
   for (const auto& p : sp_patches) {
-    patches.append(std::make_shared<PySpline>(p)->ToDerived());
+    const std::string name = p->SplinepySplineName();
+    auto derived_type = derived_types.find(name);
+    if (derived_type == derived_types.end()) {
+      derived_type =
+          derived_types.emplace(name, name_to_type[py::str(name)]).first;
+    }
+    patches.append(derived_type->second(py::arg("spline") =
+                                            std::make_shared<PySpline>(p)));
   }
   return patches;
 }
@@ -291,6 +349,9 @@ void init_spline_extensions(py::module& m) {
         py::arg("para_dim"),
         py::arg("knots"),
         py::arg("tolerance"));
+  m.def("normalize_knot_vectors",
+        &splinepy::py::NormalizeKnotVectors,
+        py::arg("spline"));
   m.def("multiply", &splinepy::py::Multiply, py::arg("a"), py::arg("b"));
   m.def("add", &splinepy::py::Add, py::arg("a"), py::arg("b"));
   m.def("compose", &splinepy::py::Compose, py::arg("outer"), py::arg("inner"));
@@ -53,6 +53,20 @@ def test_fit_curve_2d_approximation():
     )
 
 
+def test_fit_curve_empty_knot_vector():
+    x = np.linspace(-2, 2, 20)
+    fitting_points = np.vstack((x, x**2)).T
+
+    reference, _ = splinepy.helpme.fit.curve(
+        fitting_points=fitting_points, degree=2
+    )
+    empty_kv, _ = splinepy.helpme.fit.curve(
+        fitting_points=fitting_points, degree=2, knot_vector=[]
+    )
+
+    assert np.allclose(reference.control_points, empty_kv.control_points)
+
+
 def test_fit_surface_3d_interpolation():
     sample_size = [15, 10]
     x = [np.linspace(-2, 2, n) for n in sample_size]
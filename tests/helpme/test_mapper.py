@@ -5,8 +5,24 @@ import pytest
 
 import splinepy
 
-
-@pytest.fixture
+# 9-point stencil offsets used for finite differences, in units of dx
+_FD_OFFSETS = np.array(
+    [
+        [-1, -1],
+        [0, -2],
+        [1, -1],
+        [-2, 0],
+        [0, 0],
+        [2, 0],
+        [-1, 1],
+        [0, 2],
+        [1, 1],
+    ],
+    dtype=np.float64,
+)
+
+
+@pytest.fixture(scope="module")
 def scaling3D():
     return splinepy.Bezier(
         degrees=[1, 1, 1],
@@ -23,13 +39,13 @@ def scaling3D():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rotation_matrix():
     cc, ss = np.cos(0.17), np.sin(0.17)
     return np.array(((cc, -ss), (ss, cc)))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rotating2D(rotation_matrix):
     rotating2D = splinepy.Bezier(
         degrees=[1, 1],
@@ -40,13 +56,11 @@ def rotating2D(rotation_matrix):
             [1, 1],
         ],
     )
-    rotating2D.control_points = np.einsum(
-        "ij,qj->qi", rotation_matrix, rotating2D.control_points
-    )
+    rotating2D.control_points = rotating2D.control_points @ rotation_matrix.T
     return rotating2D
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def askew_spline2D():
     return splinepy.BSpline(
         degrees=[2, 2],
@@ -88,14 +102,16 @@ def solution_field_rando2D(np_rng):
     )
 
 
-@pytest.fixture
-def query_points2D(np_rng):
-    return np_rng.random((13, 2))
+# module scope - queries are only read. np_rng can't be used here, as it is
+# function scoped
+@pytest.fixture(scope="module")
+def query_points2D():
+    return np.random.default_rng().random((13, 2))
 
 
-@pytest.fixture
-def query_points3D(np_rng):
-    return np_rng.random((17, 3))
+@pytest.fixture(scope="module")
+def query_points3D():
+    return np.random.default_rng().random((17, 3))
 
 
 def test_cross_evaluation_of_different_implementations(
@@ -185,52 +201,60 @@ def test_first_order_derivatives_analytical(
     mapper2D = solution_field_rando.mapper(rotating2D)
     mapper3D = solution_field_mono3D.mapper(scaling3D)
     bf_gradient, support = mapper2D.basis_gradient_and_support(query_points2D)
+    bf_reference = np.empty(
+        (
+            query_points2D.shape[0],
+            np.prod(solution_field_rando.degrees + 1),
+            2,
+        )
+    )
     (
-        bf_reference0,
+        bf_reference[:, :, 0],
         supportb,
     ) = solution_field_rando.basis_derivative_and_support(
         query_points2D, [1, 0]
     )
     (
-        bf_reference1,
+        bf_reference[:, :, 1],
         supportb,
     ) = solution_field_rando.basis_derivative_and_support(
         query_points2D, [0, 1]
     )
-    bf_reference = np.dstack((bf_reference0, bf_reference1))
 
     assert np.allclose(support, supportb)
 
     # Rotate bf_reference
-    bf_reference = np.einsum("ij,qsj->qsi", rotation_matrix, bf_reference)
+    bf_reference = bf_reference @ rotation_matrix.T
 
     assert np.allclose(bf_gradient, bf_reference)
 
     bf_gradient, support = mapper3D.basis_gradient_and_support(query_points3D)
+    bf_reference = np.empty(
+        (
+            query_points3D.shape[0],
+            np.prod(solution_field_mono3D.degrees + 1),
+            3,
+        )
+    )
     (
-        bf_reference0,
+        bf_reference[:, :, 0],
         supportb,
     ) = solution_field_mono3D.basis_derivative_and_support(
         query_points3D, [1, 0, 0]
     )
     (
-        bf_reference1,
+        bf_reference[:, :, 1],
         supportb,
     ) = solution_field_mono3D.basis_derivative_and_support(
         query_points3D, [0, 1, 0]
     )
     (
-        bf_reference2,
+        bf_reference[:, :, 2],
         supportb,
     ) = solution_field_mono3D.basis_derivative_and_support(
         query_points3D, [0, 0, 1]
     )
-    bf_reference = np.dstack((bf_reference0, bf_reference1, bf_reference2))
-    bf_reference = np.einsum(
-        "qsi,i->qsi",
-        bf_reference,
-        1 / np.array([2.0, 0.3, 1.5]),
-    )
+    bf_reference /= np.array([2.0, 0.3, 1.5])
     assert np.allclose(bf_gradient, bf_reference)
 
 
@@ -239,7 +263,7 @@ def test_second_order_analytical(
 ):
     mapper2D = solution_field_rando.mapper(rotating2D)
     bf_hessian, support = mapper2D.basis_hessian_and_support(query_points2D)
-    bf_reference = np.zeros(
+    bf_reference = np.empty(
         (
             query_points2D.shape[0],
             np.prod(solution_field_rando.degrees + 1),
@@ -254,29 +278,22 @@ def test_second_order_analytical(
     ) = solution_field_rando.basis_derivative_and_support(
         query_points2D, [2, 0]
     )
-    (
-        bf_reference[:, :, 1, 0],
-        supportb,
-    ) = solution_field_rando.basis_derivative_and_support(
+    # mixed derivatives are symmetric - write both entries at once
+    mixed, supportb = solution_field_rando.basis_derivative_and_support(
         query_points2D, [1, 1]
     )
+    bf_reference[:, :, 0, 1] = bf_reference[:, :, 1, 0] = mixed
     (
         bf_reference[:, :, 1, 1],
         supportc,
     ) = solution_field_rando.basis_derivative_and_support(
         query_points2D, [0, 2]
     )
-    bf_reference[:, :, 0, 1] = bf_reference[:, :, 1, 0]
 
     assert np.allclose(support, supportb) and np.allclose(support, supportc)
 
     # Rotate bf_reference
-    bf_reference = np.einsum(
-        "ij,qsjk,kl->qsil",
-        rotation_matrix,
-        bf_reference,
-        rotation_matrix.T,
-    )
+    bf_reference = rotation_matrix @ bf_reference @ rotation_matrix.T
 
     assert np.allclose(bf_hessian, bf_reference)
 
@@ -303,20 +320,8 @@ def test_second_order_fd(np_rng, askew_spline2D, solution_field_rando2D):
     )
 
     # Compute aux values for FD
-    center_point = askew_spline2D.evaluate(center_point_reference)
-    center_point = np.repeat(center_point, 9, axis=0)
-    center_point += np.array(
-        [
-            [-dx, -dx],
-            [0, -2 * dx],
-            [dx, -dx],
-            [-2 * dx, 0],
-            [0, 0],
-            [2 * dx, 0],
-            [-dx, dx],
-            [0, 2 * dx],
-            [dx, dx],
-        ]
+    center_point = (
+        askew_spline2D.evaluate(center_point_reference) + _FD_OFFSETS * dx
     )
     # Approximate points in the physical domain
     center_point_parametric = askew_spline2D.proximities(
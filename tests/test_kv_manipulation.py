@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import splinepy
 
@@ -70,6 +71,20 @@ def test_insert_knot_status_return(np_rng):
             assert all(successful == ref)
 
 
+def test_knots_out_of_range(bspline_2p2d, nurbs_2p2d):
+    """Knot insertion / removal should raise for invalid requests."""
+    for spline in (bspline_2p2d, nurbs_2p2d):
+        for knot_operation in (spline.insert_knots, spline.remove_knots):
+            with pytest.raises(ValueError, match="Too big"):
+                knot_operation(0, [0.5, 1.1])
+
+            with pytest.raises(ValueError, match="Too small"):
+                knot_operation(1, [-0.1])
+
+            with pytest.raises(ValueError, match="parametric dimension"):
+                knot_operation(-1, [0.5])
+
+
 def test_insert_knot_with_matrix(np_rng, bspline_2p2d, nurbs_2p2d):
     """Test the knot insertion function (.insert_knot())."""
 
@@ -33,3 +33,19 @@ def test_nurbs_normalize_knot_vectors(nurbs_2p2d):
 
     for i, (ref_kv, kv) in enumerate(zip(ref, nurbs.knot_vectors)):
         assert np.allclose(ref_kv, kv), f"{i}. para dim failed to normalize"
+
+
+def test_normalize_partially_normalized_knot_vectors(bspline_2p2d):
+    """ """
+    bspline = bspline_2p2d
+
+    ref = [kv.numpy() for kv in bspline.knot_vectors]
+
+    # only manipulate first para dim. second one is already normalized
+    kv = bspline.knot_vectors[0]
+    kv[:] = np.multiply(np.add(kv, 37), 1.78934).tolist()
+
+    bspline.normalize_knot_vectors()
+
+    for i, (ref_kv, kv) in enumerate(zip(ref, bspline.knot_vectors)):
+        assert np.allclose(ref_kv, kv), f"{i}. para dim failed to normalize"